@@ -1,11 +1,13 @@
 import base64
 import cv2
+import json
 import numpy as np
 from loguru import logger
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from app.schemas.request import PredictRequest
+from app.schemas.request import PredictBatchRequest, PredictRequest
 from app.schemas.response import (
     ErrorDetail,
     ErrorResponse,
@@ -77,3 +79,201 @@ async def predict(request: PredictRequest):
         return ErrorResponse(
             error=ErrorDetail(code="INFERENCE_ERROR", message=str(e))
         )
+
+
+@router.post("/v1/predict/batch")
+async def predict_batch(request: PredictBatchRequest):
+    """Execute prediction on a batch of images.
+
+    Models that implement predict_batch process the images in
+    micro-batches on the device; others fall back to per-image
+    prediction.
+
+    Args:
+        request: Batch prediction request with model, images, and
+            parameters.
+
+    Returns:
+        Success response with one prediction result per image or error
+        response.
+    """
+    from app.main import loader, inference_executor
+
+    try:
+        _ = loader.get_model(request.model)
+    except ValueError as e:
+        return ErrorResponse(
+            error=ErrorDetail(code="MODEL_NOT_FOUND", message=str(e))
+        )
+
+    if not request.images:
+        return ErrorResponse(
+            error=ErrorDetail(
+                code="MISSING_IMAGES", message="Images are required"
+            )
+        )
+
+    images = []
+    for index, image_str in enumerate(request.images):
+        try:
+            image_data = (
+                image_str.split(",")[1] if "," in image_str else image_str
+            )
+            image_bytes = base64.b64decode(image_data)
+            nparr = np.frombuffer(image_bytes, np.uint8)
+            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        except Exception as e:
+            logger.error(f"Image decoding error at index {index}: {e}")
+            image = None
+
+        if image is None:
+            return ErrorResponse(
+                error=ErrorDetail(
+                    code="INVALID_IMAGE",
+                    message=f"Failed to decode image at index {index}",
+                )
+            )
+        images.append(image)
+
+    try:
+        results = await inference_executor.execute_batch(
+            request.model, images, request.params
+        )
+        return SuccessResponse(
+            data=[PredictResponse(**result) for result in results]
+        )
+    except RuntimeError as e:
+        if "queue is full" in str(e).lower():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Task queue is full, please try again later",
+            )
+        raise
+    except Exception as e:
+        logger.error(f"Batch inference error: {e}")
+        return ErrorResponse(
+            error=ErrorDetail(code="INFERENCE_ERROR", message=str(e))
+        )
+
+
+@router.post("/v1/predict/stream")
+async def predict_stream(request: PredictRequest):
+    """Execute prediction with streaming response (SSE).
+
+    Each shape is sent as soon as the model finishes post-processing
+    it, followed by a final done event, so clients with many
+    detections see first results before the full set is ready.
+
+    Args:
+        request: Prediction request with model, image, and parameters.
+
+    Returns:
+        StreamingResponse with SSE events for shapes or error response.
+    """
+    import asyncio
+    import queue
+    import threading
+    from app.main import loader, inference_executor
+
+    try:
+        model = loader.get_model(request.model)
+    except ValueError as e:
+        return ErrorResponse(
+            error=ErrorDetail(code="MODEL_NOT_FOUND", message=str(e))
+        )
+
+    if not hasattr(model, "predict_stream"):
+        return ErrorResponse(
+            error=ErrorDetail(
+                code="INVALID_MODEL",
+                message="Model does not support streaming prediction",
+            )
+        )
+
+    try:
+        image_data = (
+            request.image.split(",")[1]
+            if "," in request.image
+            else request.image
+        )
+        image_bytes = base64.b64decode(image_data)
+        nparr = np.frombuffer(image_bytes, np.uint8)
+        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+        if image is None:
+            return ErrorResponse(
+                error=ErrorDetail(
+                    code="INVALID_IMAGE", message="Failed to decode image"
+                )
+            )
+    except Exception as e:
+        logger.error(f"Image decoding error: {e}")
+        return ErrorResponse(
+            error=ErrorDetail(
+                code="INVALID_IMAGE",
+                message=f"Failed to decode image: {str(e)}",
+            )
+        )
+
+    # Streaming bypasses execute(), so reserve a queue slot explicitly
+    # to honor the same backpressure as the non-streaming endpoints.
+    try:
+        inference_executor.acquire_slot()
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Task queue is full, please try again later",
+        )
+
+    event_queue = queue.Queue()
+    prediction_done = threading.Event()
+    stop_signal = threading.Event()
+
+    def run_prediction():
+        try:
+            for shape in model.predict_stream(image, request.params):
+                if stop_signal.is_set():
+                    logger.info("Prediction stopped by client disconnect")
+                    break
+                event_queue.put({"type": "shape", "shape": shape.model_dump()})
+            else:
+                event_queue.put({"type": "done"})
+        except Exception as e:
+            logger.error(f"Stream prediction error: {e}")
+            event_queue.put({"type": "error", "message": str(e)})
+        finally:
+            inference_executor.release_slot()
+            prediction_done.set()
+
+    async def async_event_generator():
+        inference_executor.executor.submit(run_prediction)
+
+        loop = asyncio.get_event_loop()
+        try:
+            while not prediction_done.is_set() or not event_queue.empty():
+                try:
+                    event = await asyncio.wait_for(
+                        loop.run_in_executor(
+                            None, lambda: event_queue.get(timeout=0.1)
+                        ),
+                        timeout=0.2,
+                    )
+                    yield f"data: {json.dumps(event)}\n\n"
+                except (asyncio.TimeoutError, queue.Empty):
+                    continue
+        except GeneratorExit:
+            logger.info("Client disconnected, stopping prediction")
+            stop_signal.set()
+        finally:
+            stop_signal.set()
+
+    return StreamingResponse(
+        async_event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+            "Content-Type": "text/event-stream; charset=utf-8",
+        },
+    )
@@ -38,6 +38,10 @@ class PerformanceConfig(BaseModel):
 class ConcurrencyConfig(BaseModel):
     max_workers: int = 4
     max_queue_size: int = 50
+    # OpenCV threads per operation; 1 avoids oversubscription when
+    # requests are already parallelized across workers, -1 keeps the
+    # OpenCV default.
+    opencv_num_threads: int = 1
 
 
 class Settings(BaseModel):
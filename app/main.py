@@ -3,6 +3,7 @@ from loguru import logger
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app import __version__
 from app.core.config import get_settings
@@ -62,6 +63,7 @@ async def lifespan(app: FastAPI):
         loader=loader,
         max_workers=settings.concurrency.max_workers,
         max_queue_size=settings.concurrency.max_queue_size,
+        opencv_num_threads=settings.concurrency.opencv_num_threads,
     )
 
     check_for_updates_async()
@@ -79,6 +81,7 @@ app = FastAPI(
     description="AI Model Inference Service for X-AnyLabeling",
     version=str(__version__),
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 setup_cors(app, settings.security.cors_origins)
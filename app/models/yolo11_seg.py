@@ -1,6 +1,12 @@
 import cv2
 import numpy as np
-from typing import Any, Dict
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
 
 from . import BaseModel
 from app.schemas.shape import Shape
@@ -13,28 +19,150 @@ from app.core.registry import register_model
 class YOLO11Segmentation(BaseModel):
     """YOLO11 instance segmentation model."""
 
+    # Upper bound for the pinned readback buffer; larger transfers use
+    # the plain pageable path so one oversized request cannot
+    # permanently page-lock host memory.
+    _PINNED_BUF_MAX_BYTES = 64 * 1024 * 1024
+
     @staticmethod
     def mask_to_polygon(
         mask: np.ndarray, epsilon_factor: float = 0.001
     ) -> np.ndarray:
         """Convert binary mask to polygon contour points."""
-        mask_uint8 = (mask * 255).astype(np.uint8)
+        if mask.dtype == np.uint8:
+            mask_uint8 = mask
+        else:
+            mask_uint8 = (mask * 255).astype(np.uint8)
         contours, _ = cv2.findContours(
-            mask_uint8, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            mask_uint8, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_KCOS
         )
 
         if not contours:
-            return np.zeros((0, 2), dtype=np.float32)
+            return np.zeros((0, 2), dtype=np.float64)
 
         contour = max(contours, key=cv2.contourArea)
 
-        if epsilon_factor > 0:
+        # Teh-Chin approximation already thins the contour during
+        # tracing; only run the extra Douglas-Peucker pass when the
+        # result is still dense.
+        if epsilon_factor > 0 and len(contour) > 256:
             epsilon = epsilon_factor * cv2.arcLength(contour, True)
             contour = cv2.approxPolyDP(contour, epsilon, True)
 
-        points = contour.reshape(-1, 2).astype(np.float32)
+        points = contour.reshape(-1, 2).astype(np.float64)
         return points
 
+    @staticmethod
+    def _xyxy_to_corners(xyxy_np: np.ndarray) -> List[List[List[float]]]:
+        """Expand ``[K, 4]`` xyxy boxes to per-box corner point lists.
+
+        A single fancy-index plus tolist() replaces K Python-level
+        corner-list constructions.
+
+        Args:
+            xyxy_np: ``[K, 4]`` array of xyxy box coordinates.
+
+        Returns:
+            ``K`` lists of four ``[x, y]`` corners in clockwise order.
+        """
+        corners = xyxy_np[:, [0, 1, 2, 1, 2, 3, 0, 3]].astype(np.float64)
+        return corners.reshape(-1, 4, 2).tolist()
+
+    def _masks_to_numpy(
+        self, mask_data, orig_h: int, orig_w: int
+    ) -> np.ndarray:
+        """Upsample instance masks to image size in one device pass.
+
+        All masks are interpolated with a single batched kernel and
+        thresholded before leaving the device, so only one host
+        transfer of uint8 data happens per image instead of one float32
+        copy and resize per instance.
+
+        Args:
+            mask_data: ``[K, mh, mw]`` mask tensor from Ultralytics.
+            orig_h: Original image height.
+            orig_w: Original image width.
+
+        Returns:
+            ``[K, orig_h, orig_w]`` uint8 array with values 0 and 255.
+        """
+        import torch
+        import torch.nn.functional as F
+
+        if mask_data.shape[-2:] == (orig_h, orig_w):
+            masks_u8 = (mask_data > 0.5).to(torch.uint8).mul_(255)
+            if masks_u8.is_cuda:
+                return self._readback_pinned(masks_u8)
+            return masks_u8.numpy()
+
+        if mask_data.is_cuda:
+            mask_data = F.interpolate(
+                mask_data.unsqueeze(1).float(),
+                size=(orig_h, orig_w),
+                mode="bilinear",
+                align_corners=False,
+            ).squeeze(1)
+            masks_u8 = (mask_data > 0.5).to(torch.uint8).mul_(255)
+            return self._readback_pinned(masks_u8)
+
+        # On CPU, threshold at the mask resolution first and resize
+        # uint8 with OpenCV: its 8-bit kernels are SIMD-vectorized and
+        # move a quarter of the bytes of a float32 resize.
+        small = (mask_data > 0.5).to(torch.uint8).mul_(255).numpy()
+        mask_h, mask_w = small.shape[-2:]
+        interpolation = (
+            cv2.INTER_AREA
+            if orig_h < mask_h and orig_w < mask_w
+            else cv2.INTER_LINEAR
+        )
+        masks_u8 = np.empty((small.shape[0], orig_h, orig_w), dtype=np.uint8)
+        for i, mask in enumerate(small):
+            cv2.resize(
+                mask,
+                (orig_w, orig_h),
+                dst=masks_u8[i],
+                interpolation=interpolation,
+            )
+        return masks_u8
+
+    def _readback_pinned(self, tensor) -> np.ndarray:
+        """Copy a CUDA tensor to the host through a pinned buffer.
+
+        Page-locked staging memory roughly doubles PCIe transfer
+        bandwidth over pageable memory and lets the copy run
+        asynchronously on the current stream. The buffer is reused
+        across requests, capped at ``_PINNED_BUF_MAX_BYTES`` and
+        lock-guarded because the executor may run predictions
+        concurrently; transfers above the cap fall back to pageable
+        memory.
+
+        Args:
+            tensor: Contiguous CUDA tensor to transfer.
+
+        Returns:
+            Host numpy array with the tensor contents.
+        """
+        import torch
+
+        numel = tensor.numel()
+        if numel * tensor.element_size() > self._PINNED_BUF_MAX_BYTES:
+            return tensor.cpu().numpy()
+
+        with self._pinned_lock:
+            buf = self._pinned_buf
+            if buf is None or buf.numel() < numel:
+                try:
+                    buf = torch.empty(
+                        numel, dtype=tensor.dtype, pin_memory=True
+                    )
+                except RuntimeError:
+                    return tensor.cpu().numpy()
+                self._pinned_buf = buf
+            staging = buf[:numel].view(tensor.shape)
+            staging.copy_(tensor, non_blocking=True)
+            torch.cuda.current_stream().synchronize()
+            return staging.numpy().copy()
+
     def load(self):
         """Load YOLO segmentation model."""
         from ultralytics import YOLO
@@ -42,11 +170,230 @@ class YOLO11Segmentation(BaseModel):
         model_path = self.params.get("model_path", "yolo11n-seg.pt")
         device = self.params.get("device", "cpu")
 
+        if not model_path.endswith((".engine", ".plan")):
+            if device.startswith("cuda") and self.params.get(
+                "use_tensorrt", False
+            ):
+                model_path = self._build_tensorrt_engine(model_path, device)
+            elif device == "cpu" and self.params.get("use_openvino", False):
+                model_path = self._build_openvino_model(model_path)
+
+        exported = model_path.endswith(
+            (".engine", ".plan")
+        ) or model_path.endswith("_openvino_model")
+
+        # OpenCV releases the GIL inside findContours/approxPolyDP, so
+        # contour extraction parallelizes across instances while the GPU
+        # is free to start on the next request.
+        self._contour_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1
+        )
+
+        self._pinned_buf = None
+        self._pinned_lock = threading.Lock()
+
+        # One letterbox buffer per executor thread, so concurrent
+        # box-only requests never contend on a shared buffer.
+        self._letterbox_local = threading.local()
+
         self.model = YOLO(model_path)
-        self.model.to(device)
 
-        dummy_img = np.zeros((640, 640, 3), dtype=np.uint8)
-        self.model(dummy_img, verbose=False)
+        if exported:
+            # Exported runtimes pick their execution plan from the first
+            # shapes they see; warm up at the maximum batch so TensorRT
+            # tactic selection and OpenVINO throughput streams match the
+            # shapes predict_batch actually submits.
+            micro_batch_size = max(1, self.params.get("micro_batch_size", 8))
+            dummy_img = np.zeros((640, 640, 3), dtype=np.uint8)
+            self.model(
+                [dummy_img] * micro_batch_size,
+                batch=micro_batch_size,
+                verbose=False,
+            )
+        else:
+            self.model.to(device)
+            dummy_img = np.zeros((640, 640, 3), dtype=np.uint8)
+            self.model(dummy_img, verbose=False)
+
+        self._names = getattr(self.model, "names", None)
+
+        # The task is known once at load time; assume masks are present
+        # when the backend does not report a task.
+        task = getattr(self.model, "task", None)
+        self._has_masks = task == "segment" if task else True
+
+    def _export_precision(self) -> str:
+        """Resolve the export precision from params.
+
+        Returns:
+            One of ``fp32``, ``fp16`` or ``int8``. Falls back to the
+            legacy ``fp16`` boolean param when ``precision`` is unset.
+        """
+        precision = self.params.get("precision")
+        if precision is None:
+            precision = "fp16" if self.params.get("fp16", True) else "fp32"
+        if precision not in ("fp32", "fp16", "int8"):
+            logger.warning(
+                f"[{self.model_id}] Unknown precision '{precision}', "
+                f"using fp16"
+            )
+            precision = "fp16"
+        return precision
+
+    def _build_tensorrt_engine(self, model_path: str, device: str) -> str:
+        """Export PyTorch weights to a TensorRT engine, with caching.
+
+        The engine is stored next to the ``.pt`` file and keyed by GPU
+        compute capability and TensorRT version, since engines are not
+        portable across either.
+
+        Args:
+            model_path: Path to the ``.pt`` weights.
+            device: CUDA device string (e.g. ``cuda:0``).
+
+        Returns:
+            Path to the engine file, or the original ``model_path`` if
+            the export is unavailable or fails.
+        """
+        import torch
+        from ultralytics import YOLO
+
+        try:
+            import tensorrt
+        except ImportError:
+            logger.warning(
+                f"[{self.model_id}] TensorRT not installed, "
+                f"falling back to PyTorch weights"
+            )
+            return model_path
+
+        device_index = int(device.split(":")[1]) if ":" in device else 0
+        major, minor = torch.cuda.get_device_capability(device_index)
+        trt_version = tensorrt.__version__.replace(".", "")
+
+        precision = self._export_precision()
+        export_kwargs = {}
+        if precision == "int8":
+            # INT8 needs representative images; Ultralytics reads them
+            # from a dataset yaml given via data=.
+            calib_data = self.params.get("calib_data")
+            if not calib_data:
+                logger.warning(
+                    f"[{self.model_id}] INT8 export requires calib_data, "
+                    f"using fp16 instead"
+                )
+                precision = "fp16"
+            else:
+                export_kwargs["data"] = calib_data
+
+        # Key the cache by the precision actually built, after any
+        # fallback, so a later run with calib_data never reuses a
+        # downgraded engine under the int8 name.
+        weights = Path(model_path)
+        engine_path = weights.with_name(
+            f"{weights.stem}_{precision}_sm{major}{minor}"
+            f"_trt{trt_version}.engine"
+        )
+
+        if engine_path.exists():
+            return str(engine_path)
+
+        micro_batch_size = max(1, self.params.get("micro_batch_size", 8))
+        try:
+            logger.info(
+                f"[{self.model_id}] Exporting TensorRT engine to "
+                f"{engine_path}..."
+            )
+            exported = YOLO(model_path).export(
+                format="engine",
+                half=precision == "fp16",
+                int8=precision == "int8",
+                dynamic=True,
+                imgsz=self.params.get("imgsz", 640),
+                batch=micro_batch_size,
+                workspace=4,
+                device=device,
+                verbose=False,
+                **export_kwargs,
+            )
+            Path(exported).rename(engine_path)
+            return str(engine_path)
+        except Exception as e:
+            logger.warning(
+                f"[{self.model_id}] TensorRT export failed ({e}), "
+                f"falling back to PyTorch weights"
+            )
+            return model_path
+
+    def _build_openvino_model(self, model_path: str) -> str:
+        """Export PyTorch weights to an OpenVINO model, with caching.
+
+        OpenVINO's CPU runtime is considerably faster than PyTorch eager
+        mode; Ultralytics loads the exported directory and configures
+        the inference streams for throughput when given batched input.
+
+        Args:
+            model_path: Path to the ``.pt`` weights.
+
+        Returns:
+            Path to the OpenVINO model directory, or the original
+            ``model_path`` if the export is unavailable or fails.
+        """
+        from ultralytics import YOLO
+
+        try:
+            import openvino  # noqa: F401
+        except ImportError:
+            logger.warning(
+                f"[{self.model_id}] OpenVINO not installed, "
+                f"falling back to PyTorch weights"
+            )
+            return model_path
+
+        precision = self._export_precision()
+        export_kwargs = {}
+        if precision == "int8":
+            calib_data = self.params.get("calib_data")
+            if not calib_data:
+                logger.warning(
+                    f"[{self.model_id}] INT8 export requires calib_data, "
+                    f"using default precision instead"
+                )
+                precision = "fp32"
+            else:
+                export_kwargs["data"] = calib_data
+
+        weights = Path(model_path)
+        suffix = (
+            "_int8_openvino_model"
+            if precision == "int8"
+            else "_openvino_model"
+        )
+        ov_dir = weights.with_name(f"{weights.stem}{suffix}")
+
+        if ov_dir.exists():
+            return str(ov_dir)
+
+        micro_batch_size = max(1, self.params.get("micro_batch_size", 8))
+        try:
+            logger.info(
+                f"[{self.model_id}] Exporting OpenVINO model to {ov_dir}..."
+            )
+            exported = YOLO(model_path).export(
+                format="openvino",
+                int8=precision == "int8",
+                imgsz=self.params.get("imgsz", 640),
+                batch=micro_batch_size,
+                verbose=False,
+                **export_kwargs,
+            )
+            return str(exported)
+        except Exception as e:
+            logger.warning(
+                f"[{self.model_id}] OpenVINO export failed ({e}), "
+                f"falling back to PyTorch weights"
+            )
+            return model_path
 
     def predict(
         self, image: np.ndarray, params: Dict[str, Any]
@@ -69,89 +416,287 @@ class YOLO11Segmentation(BaseModel):
 
         orig_h, orig_w = image.shape[:2]
 
+        return_masks = params.get(
+            "return_masks", self.params.get("return_masks", True)
+        )
+        if not return_masks and self.params.get("pre_letterbox", False):
+            return self._predict_letterboxed(
+                image, params, conf_threshold, iou_threshold
+            )
+
+        results = self.model(
+            image, conf=conf_threshold, iou=iou_threshold, verbose=False
+        )
+
+        shapes = self._parse_results(results, orig_h, orig_w, params)
+
+        return {"shapes": shapes, "description": ""}
+
+    def _predict_letterboxed(
+        self,
+        image: np.ndarray,
+        params: Dict[str, Any],
+        conf_threshold: float,
+        iou_threshold: float,
+    ) -> Dict[str, Any]:
+        """Run box-only inference on a reused letterbox buffer.
+
+        The image is resized into the top-left corner of a per-thread
+        114-gray square buffer, avoiding the per-call letterbox
+        allocation inside the Ultralytics preprocessor, and the
+        resulting box coordinates are scaled back to the original image
+        frame. Only used for box-only requests: undoing the padding on
+        masks would cost an extra crop and resize per instance.
+
+        Args:
+            image: Input image in BGR format.
+            params: Inference parameters.
+            conf_threshold: Confidence threshold.
+            iou_threshold: IoU threshold.
+
+        Returns:
+            Dictionary with detection results.
+        """
+        imgsz = self.params.get("imgsz", 640)
+        orig_h, orig_w = image.shape[:2]
+        ratio = min(imgsz / orig_h, imgsz / orig_w)
+        new_w = max(1, round(orig_w * ratio))
+        new_h = max(1, round(orig_h * ratio))
+
+        buf = getattr(self._letterbox_local, "buf", None)
+        if buf is None or buf.shape[0] != imgsz:
+            buf = np.empty((imgsz, imgsz, 3), dtype=np.uint8)
+            self._letterbox_local.buf = buf
+        buf[:] = 114
+        cv2.resize(
+            image,
+            (new_w, new_h),
+            dst=buf[:new_h, :new_w],
+            interpolation=cv2.INTER_LINEAR,
+        )
+        results = self.model(
+            buf,
+            imgsz=imgsz,
+            conf=conf_threshold,
+            iou=iou_threshold,
+            verbose=False,
+        )
+
+        # Boxes are in the letterboxed frame; the image sits at the
+        # top-left, so mapping back is a pure rescale plus clamp.
+        shapes = self._parse_results(results, new_h, new_w, params)
+        inv_ratio = 1.0 / ratio
+        for shape in shapes:
+            shape.points = [
+                [
+                    min(max(x * inv_ratio, 0.0), float(orig_w)),
+                    min(max(y * inv_ratio, 0.0), float(orig_h)),
+                ]
+                for x, y in shape.points
+            ]
+
+        return {"shapes": shapes, "description": ""}
+
+    def predict_stream(
+        self, image: np.ndarray, params: Dict[str, Any]
+    ) -> Iterator[Shape]:
+        """Execute instance segmentation, yielding shapes incrementally.
+
+        Each shape is yielded as soon as its post-processing completes,
+        so a streaming transport can start sending results while the
+        remaining contours are still being extracted.
+
+        Args:
+            image: Input image in BGR format.
+            params: Inference parameters.
+
+        Yields:
+            Detected shapes in detection order.
+        """
+        conf_threshold = params.get(
+            "conf_threshold", self.params.get("conf_threshold", 0.25)
+        )
+        iou_threshold = params.get(
+            "iou_threshold", self.params.get("iou_threshold", 0.70)
+        )
+
+        orig_h, orig_w = image.shape[:2]
+
         results = self.model(
             image, conf=conf_threshold, iou=iou_threshold, verbose=False
         )
 
-        shapes = []
+        yield from self._iter_shapes(results, orig_h, orig_w, params)
+
+    def predict_batch(
+        self, images: List[np.ndarray], params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Execute instance segmentation on a batch of images.
+
+        Images are forwarded to the model in micro-batches of
+        ``micro_batch_size`` so the GPU processes several frames per
+        call instead of one model invocation per image.
+
+        Args:
+            images: List of input images in BGR format.
+            params: Inference parameters shared by all images.
+
+        Returns:
+            List of result dictionaries, one per input image.
+        """
+        conf_threshold = params.get(
+            "conf_threshold", self.params.get("conf_threshold", 0.25)
+        )
+        iou_threshold = params.get(
+            "iou_threshold", self.params.get("iou_threshold", 0.70)
+        )
+        micro_batch_size = max(1, self.params.get("micro_batch_size", 8))
+
+        outputs = []
+        for start in range(0, len(images), micro_batch_size):
+            batch = images[start : start + micro_batch_size]
+            # batch= is what steers OpenVINO's AutoBackend to the
+            # throughput hint; the list input alone does not.
+            results = self.model(
+                batch,
+                conf=conf_threshold,
+                iou=iou_threshold,
+                batch=micro_batch_size,
+                verbose=False,
+            )
+            for image, result in zip(batch, results):
+                orig_h, orig_w = image.shape[:2]
+                shapes = self._parse_results([result], orig_h, orig_w, params)
+                outputs.append({"shapes": shapes, "description": ""})
+
+        return outputs
+
+    def _parse_results(
+        self,
+        results,
+        orig_h: int,
+        orig_w: int,
+        params: Dict[str, Any],
+    ) -> List[Shape]:
+        """Convert Ultralytics results into annotation shapes.
+
+        Args:
+            results: Ultralytics results for a single image.
+            orig_h: Original image height.
+            orig_w: Original image width.
+            params: Inference parameters.
+
+        Returns:
+            List of shapes extracted from the results.
+        """
+        return list(self._iter_shapes(results, orig_h, orig_w, params))
+
+    def _iter_shapes(
+        self,
+        results,
+        orig_h: int,
+        orig_w: int,
+        params: Dict[str, Any],
+    ) -> Iterator[Shape]:
+        """Yield annotation shapes as their post-processing completes.
+
+        Contour extraction for later instances keeps running on the
+        pool while earlier shapes are already being consumed, so a
+        streaming caller overlaps serialization with the remaining
+        CPU work.
+
+        Args:
+            results: Ultralytics results for a single image.
+            orig_h: Original image height.
+            orig_w: Original image width.
+            params: Inference parameters.
+
+        Yields:
+            Shapes extracted from the results, in detection order.
+        """
         show_boxes = self.params.get("show_boxes", False)
         epsilon_factor = params.get(
             "epsilon_factor", self.params.get("epsilon_factor", 0.001)
         )
+        return_masks = params.get(
+            "return_masks", self.params.get("return_masks", True)
+        )
 
         for result in results:
             boxes = result.boxes
+            names = self._names if self._names else result.names
 
-            if hasattr(result, "masks") and result.masks is not None:
-                mask_data = result.masks.data.cpu().numpy()
+            if return_masks and self._has_masks and result.masks is not None:
+                mask_data = self._masks_to_numpy(
+                    result.masks.data, orig_h, orig_w
+                )
 
-                for i, mask in enumerate(mask_data):
-                    cls = int(boxes[i].cls[0])
-                    conf = float(boxes[i].conf[0])
-                    label = result.names[cls]
+                # Copy box attributes to the host once per image; indexing
+                # boxes[i] creates a sub-object and syncs the device per
+                # instance.
+                cls_np = boxes.cls.int().cpu().numpy()
+                conf_np = boxes.conf.cpu().numpy()
+                if show_boxes:
+                    corners_list = self._xyxy_to_corners(
+                        boxes.xyxy.cpu().numpy()
+                    )
 
-                    mask_h, mask_w = mask.shape
-                    if mask_h != orig_h or mask_w != orig_w:
-                        mask = cv2.resize(
-                            mask.astype(np.float32),
-                            (orig_w, orig_h),
-                            interpolation=cv2.INTER_LINEAR,
-                        )
+                to_polygon = partial(
+                    self.mask_to_polygon, epsilon_factor=epsilon_factor
+                )
+                if len(mask_data) > 1:
+                    # map() submits every mask up front and yields
+                    # results in order, so later contours keep running
+                    # while earlier shapes are consumed.
+                    polygons = self._contour_pool.map(to_polygon, mask_data)
+                else:
+                    polygons = map(to_polygon, mask_data)
 
-                    points = self.mask_to_polygon(mask, epsilon_factor)
+                for i, points in enumerate(polygons):
+                    conf = float(conf_np[i])
+                    label = names[int(cls_np[i])]
 
                     if len(points) < 3:
                         continue
 
-                    points_list = [[float(x), float(y)] for x, y in points]
-                    if points_list and points_list[0] != points_list[-1]:
-                        points_list.append(points_list[0])
+                    # findContours returns open contours, so the polygon
+                    # is always closed by repeating the first vertex.
+                    points_list = points.tolist()
+                    points_list.append(points_list[0])
 
                     if show_boxes:
-                        xyxy = boxes[i].xyxy[0].cpu().numpy()
-                        bbox_shape = Shape(
+                        bbox_shape = Shape.model_construct(
                             label=label,
                             shape_type="rectangle",
-                            points=[
-                                [float(xyxy[0]), float(xyxy[1])],
-                                [float(xyxy[2]), float(xyxy[1])],
-                                [float(xyxy[2]), float(xyxy[3])],
-                                [float(xyxy[0]), float(xyxy[3])],
-                            ],
+                            points=corners_list[i],
                             score=conf,
                         )
-                        shapes.append(bbox_shape)
+                        yield bbox_shape
 
-                    mask_shape = Shape(
+                    mask_shape = Shape.model_construct(
                         label=label,
                         shape_type="polygon",
                         points=points_list,
                         score=conf,
                     )
-                    shapes.append(mask_shape)
+                    yield mask_shape
             elif boxes is not None:
-                for box in boxes:
-                    xyxy = box.xyxy[0].cpu().numpy()
-                    conf = float(box.conf[0])
-                    cls = int(box.cls[0])
-                    label = result.names[cls]
+                cls_np = boxes.cls.int().cpu().numpy()
+                conf_np = boxes.conf.cpu().numpy()
+                corners_list = self._xyxy_to_corners(boxes.xyxy.cpu().numpy())
 
-                    shape = Shape(
-                        label=label,
+                for i in range(len(cls_np)):
+                    shape = Shape.model_construct(
+                        label=names[int(cls_np[i])],
                         shape_type="rectangle",
-                        points=[
-                            [float(xyxy[0]), float(xyxy[1])],
-                            [float(xyxy[2]), float(xyxy[1])],
-                            [float(xyxy[2]), float(xyxy[3])],
-                            [float(xyxy[0]), float(xyxy[3])],
-                        ],
-                        score=conf,
+                        points=corners_list[i],
+                        score=float(conf_np[i]),
                     )
-                    shapes.append(shape)
-
-        return {"shapes": shapes, "description": ""}
+                    yield shape
 
     def unload(self):
         """Release model resources."""
+        if hasattr(self, "_contour_pool"):
+            self._contour_pool.shutdown(wait=False)
         if hasattr(self, "model"):
             del self.model
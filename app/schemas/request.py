@@ -10,6 +10,14 @@ class PredictRequest(BaseModel):
     params: Dict[str, Any] = {}
 
 
+class PredictBatchRequest(BaseModel):
+    """Request schema for batch prediction endpoint."""
+
+    model: str
+    images: List[str]
+    params: Dict[str, Any] = {}
+
+
 class VideoInitRequest(BaseModel):
     """Request schema for video session initialization."""
 
@@ -1,4 +1,5 @@
 import asyncio
+import cv2
 import numpy as np
 from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
@@ -11,7 +12,11 @@ class InferenceExecutor:
     """Inference task executor with concurrency control."""
 
     def __init__(
-        self, loader: ModelRegistry, max_workers: int, max_queue_size: int
+        self,
+        loader: ModelRegistry,
+        max_workers: int,
+        max_queue_size: int,
+        opencv_num_threads: int = 1,
     ):
         """Initialize inference executor.
 
@@ -19,12 +24,22 @@ class InferenceExecutor:
             loader: Model loader instance.
             max_workers: Maximum number of concurrent inference tasks.
             max_queue_size: Maximum task queue size.
+            opencv_num_threads: Threads OpenCV may use per operation.
+                Requests are already parallelized across the worker
+                pool, so capping this (default 1) avoids thread
+                oversubscription under load; -1 keeps OpenCV's default.
         """
         self.loader = loader
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.max_queue_size = max_queue_size
         self._queue_size = 0
 
+        if opencv_num_threads >= 0:
+            cv2.setNumThreads(opencv_num_threads)
+            logger.info(
+                f"OpenCV threads per operation set to {opencv_num_threads}"
+            )
+
     async def execute(
         self, model_id: str, image: np.ndarray, params: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -54,6 +69,60 @@ class InferenceExecutor:
         finally:
             self._queue_size -= 1
 
+    async def execute_batch(
+        self,
+        model_id: str,
+        images: list,
+        params: Dict[str, Any],
+    ) -> list:
+        """Execute inference on a batch of images asynchronously.
+
+        Args:
+            model_id: Model identifier.
+            images: List of input images.
+            params: Inference parameters shared by all images.
+
+        Returns:
+            List of inference results, one per image.
+
+        Raises:
+            RuntimeError: If queue is full.
+        """
+        if self._queue_size >= self.max_queue_size:
+            raise RuntimeError("Task queue is full")
+
+        self._queue_size += 1
+        try:
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                self.executor,
+                self._run_inference_batch,
+                model_id,
+                images,
+                params,
+            )
+            return result
+        finally:
+            self._queue_size -= 1
+
+    def acquire_slot(self):
+        """Reserve a queue slot for an out-of-band task.
+
+        Streaming endpoints submit their producer to the shared thread
+        pool themselves; reserving a slot keeps them counted against
+        the same backpressure limit as regular predictions.
+
+        Raises:
+            RuntimeError: If queue is full.
+        """
+        if self._queue_size >= self.max_queue_size:
+            raise RuntimeError("Task queue is full")
+        self._queue_size += 1
+
+    def release_slot(self):
+        """Release a slot reserved with acquire_slot."""
+        self._queue_size = max(0, self._queue_size - 1)
+
     def _run_inference(
         self, model_id: str, image: np.ndarray, params: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -70,6 +139,28 @@ class InferenceExecutor:
         model = self.loader.get_model(model_id)
         return model.predict(image, params)
 
+    def _run_inference_batch(
+        self, model_id: str, images: list, params: Dict[str, Any]
+    ) -> list:
+        """Run batch inference in thread pool.
+
+        Models that implement predict_batch process the images in
+        micro-batches on the device; others fall back to per-image
+        prediction.
+
+        Args:
+            model_id: Model identifier.
+            images: List of input images.
+            params: Inference parameters shared by all images.
+
+        Returns:
+            List of inference results, one per image.
+        """
+        model = self.loader.get_model(model_id)
+        if hasattr(model, "predict_batch"):
+            return model.predict_batch(images, params)
+        return [model.predict(image, params) for image in images]
+
     def shutdown(self):
         """Shutdown executor and wait for pending tasks."""
         logger.info("Shutting down inference executor...")